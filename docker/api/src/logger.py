@@ -1,42 +1,214 @@
 """
 Simple structured JSON logging for the Task API.
+
+Loggers from get_logger() only put records on a queue; a background listener
+thread formats them and writes them to stdout. The listener is started by the
+first get_logger() call and stopped, writing out all queued records, by
+stop_log_listener() or at interpreter exit.
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
-from datetime import datetime, timezone
+import threading
+import time
+from collections.abc import Mapping
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
 from typing import Any, Dict
 
-from pythonjsonlogger.jsonlogger import JsonFormatter  # type: ignore
+import orjson
+from pythonjsonlogger.orjson import OrjsonFormatter  # type: ignore
+
+# Name of the logger for completed requests, formatted by AccessLogFormatter
+ACCESS_LOGGER_NAME = "task-api.access"
+
+# Fields of access log records: the extra fields of the completed request log
+# call, followed by the request context; user_id is only present if known
+ACCESS_LOG_FIELDS = (
+    "status_code",
+    "duration_ms",
+    "content_type",
+    "user_agent",
+    "referer",
+    "component",
+    "operation",
+    "request_id",
+    "path",
+    "method",
+)
+ACCESS_LOG_OPTIONAL_FIELDS = ("user_id",)
+
+# Attributes an access log record may have; any other attribute means it has
+# fields AccessLogFormatter does not know about
+_ACCESS_RECORD_KEYS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+).union(("message", "asctime"), ACCESS_LOG_FIELDS, ACCESS_LOG_OPTIONAL_FIELDS)
+
+# Context of the request being handled, merged into every log record
+request_ctx: ContextVar[Mapping[str, Any]] = ContextVar(
+    "request_ctx", default=MappingProxyType({})
+)
 
+# Types accepted as request context values
+_ALLOWED_TYPES = (str, int, float, bool, list, dict, type(None))
 
-class SimpleJsonFormatter(JsonFormatter):
-    """Simple JSON formatter for structured logging."""
+
+class SimpleJsonFormatter(OrjsonFormatter):
+    """Simple JSON formatter for structured logging, encoded with orjson."""
+    
+    # Formatted date and time of the last second seen, reused within that second
+    _ts_second: int = -1
+    _ts_prefix: str = ""
+    
+    def format_timestamp(self, record: logging.LogRecord) -> str:
+        """
+        Format the creation time of a record as UTC ISO 8601 with milliseconds.
+        
+        Args:
+            record: The log record to format the timestamp of
+            
+        Returns:
+            The timestamp, e.g. 2025-01-31T12:00:00.123Z
+        """
+        second = int(record.created)
+        if second != self._ts_second:
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._ts_second = second
+        return f"{self._ts_prefix}.{int(record.msecs):03d}Z"
     
     def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]) -> None:
         """Add basic fields to the log record."""
         super().add_fields(log_record, record, message_dict)
         
         # Add basic timestamp and level
-        log_record["timestamp"] = datetime.now(timezone.utc).isoformat()
+        log_record["timestamp"] = self.format_timestamp(record)
+        log_record["level"] = record.levelname
+        log_record["logger"] = record.name
+
+
+class AccessLogFormatter(SimpleJsonFormatter):
+    """JSON formatter specialized for the fixed fields of access log records."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format an access log record without the generic field handling.
+        
+        Produces the same fields as SimpleJsonFormatter, falling back to it
+        for records that lack any of ACCESS_LOG_FIELDS or have other fields.
+        
+        Args:
+            record: The log record to format
+            
+        Returns:
+            The record encoded as a JSON string
+        """
+        fields = record.__dict__
+        if not fields.keys() <= _ACCESS_RECORD_KEYS:
+            return super().format(record)
+        
+        log_record = {"message": record.getMessage()}
+        try:
+            for name in ACCESS_LOG_FIELDS:
+                log_record[name] = fields[name]
+        except KeyError:
+            return super().format(record)
+        
+        for name in ACCESS_LOG_OPTIONAL_FIELDS:
+            if name in fields:
+                log_record[name] = fields[name]
+        log_record["timestamp"] = self.format_timestamp(record)
         log_record["level"] = record.levelname
         log_record["logger"] = record.name
         
-        # Add any extra attributes from kwargs in the log call
-        for key, value in record.__dict__.items():
-            # Skip standard LogRecord attributes to avoid clutter
-            if key not in logging.LogRecord.__dict__ and key not in [
-                "args", "exc_info", "exc_text", "stack_info", "message"
-            ]:
-                # Only add JSON serializable types
-                if isinstance(value, (str, int, float, bool, list, dict, type(None))):
-                    log_record[key] = value
+        return orjson.dumps(log_record, default=self.json_default).decode()
+
+
+class ContextQueueHandler(QueueHandler):
+    """Queue handler that keeps the request context and exception info."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a copy of a record for formatting on the listener thread.
+        
+        The request context is copied onto the record since the listener thread
+        cannot see it. Unlike the default implementation the message is not
+        pre-formatted, so dict messages and exception info still reach the JSON
+        formatter; the traceback is rendered to text now, so its frames are not
+        kept alive until the listener gets to the record.
+        
+        Args:
+            record: The log record to enqueue
+            
+        Returns:
+            The prepared log record
+        """
+        record = copy.copy(record)
+        for key, value in request_ctx.get().items():
+            record.__dict__.setdefault(key, value)
+        
+        # Merge the message arguments now, as they may change after enqueueing
+        if not isinstance(record.msg, dict):
+            record.msg = record.getMessage()
+            record.args = None
+        
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# Renders tracebacks on the logging thread, before records are enqueued
+_traceback_formatter = logging.Formatter()
+
+# Records are formatted and written to stdout by a single background thread
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(SimpleJsonFormatter("%(message)s"))
+_console_handler.addFilter(lambda record: record.name != ACCESS_LOGGER_NAME)
+_access_handler = logging.StreamHandler(sys.stdout)
+_access_handler.setFormatter(AccessLogFormatter("%(message)s"))
+_access_handler.addFilter(lambda record: record.name == ACCESS_LOGGER_NAME)
+_log_listener = QueueListener(
+    _log_queue, _console_handler, _access_handler, respect_handler_level=True
+)
+_log_listener_lock = threading.Lock()
+_log_listener_running = False
+
+
+def start_log_listener() -> None:
+    """Start writing queued log records to stdout, unless already started."""
+    global _log_listener_running
+    with _log_listener_lock:
+        if not _log_listener_running:
+            _log_listener.start()
+            _log_listener_running = True
+
+
+def stop_log_listener() -> None:
+    """Write out all queued log records and stop the listener thread."""
+    global _log_listener_running
+    with _log_listener_lock:
+        if _log_listener_running:
+            _log_listener.stop()
+            _log_listener_running = False
+
+
+# Make sure records still queued at exit are written
+atexit.register(stop_log_listener)
 
 
 def get_logger(name: str = "task-api", log_level: int = logging.INFO) -> logging.Logger:
     """
     Configure and return a logger with JSON formatting.
     
+    Records are put on a queue and written to stdout by the log listener,
+    which is started here if it is not running yet.
+    
     Args:
         name: The name of the logger
         log_level: The logging level (default: INFO)
@@ -51,11 +223,9 @@ def get_logger(name: str = "task-api", log_level: int = logging.INFO) -> logging
     if logger.handlers:
         logger.handlers.clear()
     
-    # Create console handler with JSON formatting
-    console_handler = logging.StreamHandler(sys.stdout)
-    formatter = SimpleJsonFormatter("%(message)s")
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Enqueue records for the log listener
+    logger.addHandler(ContextQueueHandler(_log_queue))
+    start_log_listener()
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -63,23 +233,22 @@ def get_logger(name: str = "task-api", log_level: int = logging.INFO) -> logging
     return logger
 
 
-def get_request_logger(logger: logging.Logger, request_id: str, **context: Any) -> logging.LoggerAdapter[logging.Logger]:
+def set_request_context(request_id: str, **context: Any) -> Token[Mapping[str, Any]]:
     """
-    Create a logger adapter with request context.
+    Set the request context included in all log records of the current request.
     
     Args:
-        logger: The base logger to adapt
         request_id: The unique ID for the request
-        context: Additional context to include in logs
+        context: Additional context to include in logs, None values are left out
         
     Returns:
-        A logger adapter with request context
+        A token to restore the previous context with request_ctx.reset()
     """
     extra: Dict[str, Any] = {"request_id": request_id}
     
     # Add any additional context
     for key, value in context.items():
-        if isinstance(value, (str, int, float, bool, list, dict, type(None))):
+        if value is not None and isinstance(value, _ALLOWED_TYPES):
             extra[key] = value
     
-    return logging.LoggerAdapter(logger, extra)
+    return request_ctx.set(extra)
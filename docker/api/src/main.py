@@ -6,23 +6,33 @@ PostgreSQL database backend. It includes endpoints for creating and listing task
 as well as a health check endpoint.
 """
 
-from logging import Logger, LoggerAdapter
+import asyncio
+import logging
 import os
 import time
-import uuid
 from collections.abc import AsyncIterator, Callable, Awaitable
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Annotated
 
 import asyncpg  # type: ignore
-from fastapi import FastAPI, HTTPException, Request, Depends, Response
+from fastapi import Body, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-
-from logger import get_logger
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from starlette.types import Receive, Scope, Send
+
+from logger import (
+    ACCESS_LOGGER_NAME,
+    get_logger,
+    request_ctx,
+    set_request_context,
+    start_log_listener,
+    stop_log_listener,
+)
 
 # Configure structured JSON logging
 logger = get_logger("task-api")
+access_logger = get_logger(ACCESS_LOGGER_NAME)
 
 # Database connection settings
 DB_HOST = os.getenv("DB_HOST", "postgres")
@@ -31,76 +41,205 @@ DB_NAME = os.getenv("DB_NAME", "taskdb")
 DB_USER = os.getenv("DB_USER", "taskuser")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "taskpass")
 
+# Connection parameters shared by all database connections
+CONNECT_KWARGS = {
+    "host": DB_HOST,
+    "port": DB_PORT,
+    "database": DB_NAME,
+    "user": DB_USER,
+    "password": DB_PASSWORD,
+}
+
+# Connection pool settings
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "10"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "50"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+
+# Paths polled by Kubernetes probes, logged at DEBUG level to reduce log volume
+QUIET_PATHS = frozenset({"/health"})
+
+# Version of the schema created by SCHEMA_SQL; bump it whenever SCHEMA_SQL
+# changes so existing databases get the new tables and indexes
+SCHEMA_VERSION = 2
+
+# Advisory lock key serializing schema creation across API pods
+SCHEMA_LOCK_ID = 727_001
+
+# Idempotent DDL for the tasks table, its indexes and the schema version table
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id SERIAL PRIMARY KEY,
+        title VARCHAR(255) NOT NULL,
+        description TEXT,
+        status VARCHAR(50) DEFAULT 'pending',
+        user_id VARCHAR(255) NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    -- Create composite index for filtering by user_id (most common use case)
+    -- and paginating a user's tasks by id
+    CREATE INDEX IF NOT EXISTS idx_tasks_user_id_id ON tasks (user_id, id);
+    -- Drop the user_id index superseded by the composite index above
+    DROP INDEX IF EXISTS idx_tasks_user_id;
+    -- Create composite index for filtering by user_id and status
+    CREATE INDEX IF NOT EXISTS idx_tasks_user_id_status
+    ON tasks (user_id, status);
+    -- Create index for sorting/filtering by creation time
+    CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+    -- Create index for status-based filtering
+    CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+    -- Track the applied schema version
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
 
-# Request ID middleware
-class RequestContextMiddleware:
-    """Middleware to add request context to each request."""
-    
-    async def __call__(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        request_id = str(uuid.uuid4())
-        # Set extra logger context for this request
-        logger_adapter = LoggerAdapter(
-            logger, 
-            {"request_id": request_id}
-        )
-        
-        # Store the logger adapter in request state
-        request.state.logger = logger_adapter
-        
-        response = await call_next(request)
-        return response
+# Hot-path queries; asyncpg caches their prepared statements per connection,
+# keyed by the SQL text, so these must stay constant. All return the task
+# columns in the order read by TaskResponse.from_row()
+INSERT_TASK_SQL = """
+    INSERT INTO tasks (title, description, user_id)
+    VALUES ($1, $2, $3)
+    RETURNING id, title, description, status, user_id
+"""
+# Ids are assigned in the ORDER BY ord row order within the statement, so
+# sorting the returned rows by id restores the input order
+INSERT_TASKS_BULK_SQL = """
+    WITH ins AS (
+        INSERT INTO tasks (title, description, user_id)
+        SELECT title, description, user_id
+        FROM unnest($1::text[], $2::text[], $3::text[]) WITH ORDINALITY
+            AS t (title, description, user_id, ord)
+        ORDER BY ord
+        RETURNING id, title, description, status, user_id
+    )
+    SELECT id, title, description, status, user_id FROM ins ORDER BY id
+"""
+SELECT_TASKS_BY_USER_SQL = """
+    SELECT id, title, description, status, user_id FROM tasks
+    WHERE user_id = $1 ORDER BY id DESC
+    LIMIT $2
+"""
+SELECT_TASKS_BY_USER_BEFORE_SQL = """
+    SELECT id, title, description, status, user_id FROM tasks
+    WHERE user_id = $1 AND id < $2 ORDER BY id DESC
+    LIMIT $3
+"""
+
+# Default and maximum number of tasks returned by a single list request
+TASKS_DEFAULT_LIMIT = 100
+TASKS_MAX_LIMIT = 1000
+
+# Largest task ID, as tasks.id is a SERIAL (int4) column
+TASKS_MAX_ID = 2_147_483_647
+
+# Maximum number of tasks created by a single bulk request
+TASKS_MAX_BULK = 1000
+
+
+async def create_pool() -> asyncpg.Pool:
+    """Create the shared database connection pool."""
+    return await asyncpg.create_pool(  # type: ignore
+        **CONNECT_KWARGS,
+        min_size=DB_POOL_MIN_SIZE,
+        max_size=DB_POOL_MAX_SIZE,
+        max_inactive_connection_lifetime=300,
+        command_timeout=60,
+        statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+    )
+
+
+async def get_pool(app: FastAPI) -> asyncpg.Pool:
+    """
+    Return the application's connection pool, creating it on first use.
+
+    The pool is normally created at startup, but if the database was not
+    reachable then, it is created lazily by the first request that needs it.
+    The schema is brought up to date before the pool is handed out, and the
+    pool is only kept once that succeeded, so a failed attempt is retried.
+
+    Args:
+        app: The FastAPI application holding the pool in its state
+
+    Returns:
+        The shared connection pool
+    """
+    if app.state.pool is None:
+        async with app.state.pool_lock:
+            if app.state.pool is None:
+                pool = await create_pool()
+                try:
+                    migrated = await ensure_schema(pool)
+                except BaseException:
+                    await pool.close()  # type: ignore
+                    raise
+                app.state.pool = pool
+
+                # Log with structured JSON
+                logger.info(
+                    "Database initialized successfully", 
+                    extra={
+                        "database": DB_NAME,
+                        "host": DB_HOST,
+                        "schema_version": SCHEMA_VERSION,
+                        "schema_migrated": migrated,
+                        "component": "database"
+                    }
+                )
+    return app.state.pool
+
+
+async def schema_is_current(conn: asyncpg.Connection) -> bool:
+    """Check whether the database schema is at SCHEMA_VERSION or newer."""
+    if await conn.fetchval("SELECT to_regclass('schema_version')") is None:  # type: ignore
+        return False
+    version = await conn.fetchval("SELECT max(version) FROM schema_version")  # type: ignore
+    return version is not None and version >= SCHEMA_VERSION
+
+
+async def ensure_schema(pool: asyncpg.Pool) -> bool:
+    """
+    Create the database schema unless it is already up to date.
+
+    Pods starting together serialize on an advisory lock, so only the first
+    one runs the DDL and the others just see the recorded schema version.
+
+    Args:
+        pool: The connection pool to use
+
+    Returns:
+        True if the schema was created or upgraded, False if it was current
+    """
+    async with pool.acquire() as conn:  # type: ignore
+        if await schema_is_current(conn):
+            return False
+
+        async with conn.transaction():  # type: ignore
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", SCHEMA_LOCK_ID)  # type: ignore
+            if await schema_is_current(conn):
+                return False
+
+            await conn.execute(SCHEMA_SQL)  # type: ignore
+            await conn.execute(  # type: ignore
+                "INSERT INTO schema_version (version) VALUES ($1)", SCHEMA_VERSION
+            )
+    return True
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Lifecycle event handler for FastAPI application."""
     # Startup
+    start_log_listener()
+    app.state.pool = None
+    app.state.pool_lock = asyncio.Lock()
     try:
-        conn = await asyncpg.connect(  # type: ignore
-            host=DB_HOST,
-            port=DB_PORT,
-            database=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-        )
-
-        # Create tasks table if it doesn't exist
-        sql = """
-            CREATE TABLE IF NOT EXISTS tasks (
-                id SERIAL PRIMARY KEY,
-                title VARCHAR(255) NOT NULL,
-                description TEXT,
-                status VARCHAR(50) DEFAULT 'pending',
-                user_id VARCHAR(255) NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            -- Create index for filtering by user_id (most common use case)
-            CREATE INDEX IF NOT EXISTS idx_tasks_user_id ON tasks (user_id);
-            -- Create composite index for filtering by user_id and status
-            CREATE INDEX IF NOT EXISTS idx_tasks_user_id_status
-            ON tasks (user_id, status);
-            -- Create index for sorting/filtering by creation time
-            CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
-            -- Create index for status-based filtering
-            CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
-        """
-        await conn.execute(sql)  # type: ignore
-
-        await conn.close()  # type: ignore
-        
-        # Log with structured JSON
-        logger.info(
-            "Database initialized successfully", 
-            extra={
-                "database": DB_NAME,
-                "host": DB_HOST,
-                "component": "database"
-            }
-        )
+        await get_pool(app)
     except Exception as e:
         # Log with structured JSON
         logger.error(
-            f"Database initialization failed: {e}", 
+            "Database initialization failed: %s",
+            e,
             extra={
                 "database": DB_NAME,
                 "host": DB_HOST,
@@ -114,17 +253,38 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Shutdown
     logger.info("Service shutting down", extra={"component": "application"})
+    if app.state.pool is not None:
+        await app.state.pool.close()  # type: ignore
+    stop_log_listener()
+
 
+class ProbeAwareCORSMiddleware(CORSMiddleware):
+    """CORS middleware that passes probe requests straight to the application."""
 
-app = FastAPI(title="Task Management API", lifespan=lifespan)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Skip CORS handling for paths only polled by Kubernetes probes."""
+        if scope["type"] == "http" and scope["path"] in QUIET_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app = FastAPI(
+    title="Task Management API",
+    lifespan=lifespan,
+    # Serialize responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
+)
 
 # Add middleware
 app.add_middleware(
-    CORSMiddleware,
+    ProbeAwareCORSMiddleware,
     allow_origins=["*"],  # For development, restrict in production
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the tracking and pagination headers
+    expose_headers=["X-Request-ID", "X-Next-Before-ID"],
 )
 
 # Add request context middleware
@@ -133,6 +293,9 @@ async def request_middleware(request: Request, call_next: Callable[[Request], Aw
     """
     Middleware to add request context and timing to each request.
     
+    Each request gets an ID of 32 lowercase hex characters (128 random bits),
+    included in its log records and returned in the X-Request-ID header.
+    
     Args:
         request: The FastAPI request object
         call_next: The next middleware or route handler
@@ -140,8 +303,8 @@ async def request_middleware(request: Request, call_next: Callable[[Request], Aw
     Returns:
         The response from the route handler
     """
-    # Generate a unique request ID
-    request_id = str(uuid.uuid4())
+    # Generate a unique request ID (32 random hex characters)
+    request_id = os.urandom(16).hex()
     
     # Extract user ID from headers or query params if available
     user_id = None
@@ -150,40 +313,44 @@ async def request_middleware(request: Request, call_next: Callable[[Request], Aw
     elif "user_id" in request.query_params:
         user_id = request.query_params.get("user_id")
     
-    # Create a request-specific logger with context
-    extra_context = {
-        "request_id": request_id,
-        "path": str(request.url.path),
-        "method": request.method
-    }
-    if user_id:
-        extra_context["user_id"] = user_id
-        
-    request.state.logger = LoggerAdapter(logger, extra_context)
+    # Set the request context picked up by every log record of this request
+    token = set_request_context(
+        request_id,
+        path=request.url.path,
+        method=request.method,
+        user_id=user_id or None,
+    )
     
-    # Record the start time for performance measurement
-    start_time = time.time()
+    # Record the start time on the monotonic clock for performance measurement
+    start_ns = time.perf_counter_ns()
     
     # Process the request
     try:
         response = await call_next(request)
         
-        # Calculate request duration
-        duration_ms = (time.time() - start_time) * 1000
-        
-        # Log the completed request
-        request.state.logger.info(
-            f"Request completed: {request.method} {request.url.path}",
-            extra={
-                "status_code": response.status_code,
-                "duration_ms": duration_ms,
-                "content_type": response.headers.get("content-type", ""),
-                "user_agent": request.headers.get("user-agent", ""),
-                "referer": request.headers.get("referer", ""),
-                "component": "http",
-                "operation": "request"
-            }
-        )
+        # Log the completed request, probe requests only at DEBUG level.
+        # Skip building the log fields entirely if the record would be dropped.
+        # Fields not listed in ACCESS_LOG_FIELDS use the slower generic formatter
+        level = logging.DEBUG if request.url.path in QUIET_PATHS else logging.INFO
+        if access_logger.isEnabledFor(level):
+            # Calculate request duration
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            
+            access_logger.log(
+                level,
+                "Request completed: %s %s",
+                request.method,
+                request.url.path,
+                extra={
+                    "status_code": response.status_code,
+                    "duration_ms": duration_ms,
+                    "content_type": response.headers.get("content-type", ""),
+                    "user_agent": request.headers.get("user-agent", ""),
+                    "referer": request.headers.get("referer", ""),
+                    "component": "http",
+                    "operation": "request"
+                }
+            )
         
         # Add request ID to response headers for tracking
         response.headers["X-Request-ID"] = request_id
@@ -191,11 +358,13 @@ async def request_middleware(request: Request, call_next: Callable[[Request], Aw
         return response
     except Exception as e:
         # Calculate request duration
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         # Log the failed request
-        request.state.logger.error(
-            f"Request failed: {request.method} {request.url.path}",
+        logger.error(
+            "Request failed: %s %s",
+            request.method,
+            request.url.path,
             extra={
                 "duration_ms": duration_ms,
                 "error": str(e),
@@ -205,14 +374,17 @@ async def request_middleware(request: Request, call_next: Callable[[Request], Aw
             exc_info=True
         )
         raise
+    finally:
+        request_ctx.reset(token)
 
 
 class Task(BaseModel):
     """Model representing a task input."""
 
-    title: str
+    # Limits match the VARCHAR(255) columns of the tasks table
+    title: str = Field(max_length=255)
     description: str | None = None
-    user_id: str
+    user_id: str = Field(max_length=255)
 
 
 class TaskResponse(BaseModel):
@@ -224,28 +396,41 @@ class TaskResponse(BaseModel):
     status: str
     user_id: str
 
+    @classmethod
+    def from_row(cls, row: asyncpg.Record) -> "TaskResponse":
+        """
+        Build a response from a tasks row without re-validating it.
+
+        Args:
+            row: A row with the id, title, description, status and user_id
+                columns, in that order
 
-async def get_request_logger_dependency(request: Request) -> Any:
-    """Dependency to get the request-specific logger."""
-    return getattr(request.state, "logger", logger)
+        Returns:
+            The task response
+        """
+        return cls.model_construct(
+            id=row[0],
+            title=row[1],
+            description=row[2],
+            status=row[3],
+            user_id=row[4],
+        )
 
 
 @app.get("/health")
-async def health_check(
-    request_logger: LoggerAdapter[Logger] = Depends(get_request_logger_dependency)
-) -> dict[str, str]:
+async def health_check() -> dict[str, str]:
     """Health check endpoint."""
-    request_logger.info("Health check request received", extra={"component": "api"})
+    logger.debug("Health check request received", extra={"component": "api"})
     return {"status": "healthy", "service": "task-api"}
 
 
 @app.post("/tasks", response_model=TaskResponse)
 async def create_task(
     task: Task, 
-    request_logger: LoggerAdapter[Logger] = Depends(get_request_logger_dependency)
+    request: Request,
 ) -> TaskResponse:
     """Create a new task."""
-    request_logger.info(
+    logger.info(
         "Creating task for user", 
         extra={
             "user_id": task.user_id,
@@ -255,24 +440,14 @@ async def create_task(
     )
     
     try:
-        conn = await asyncpg.connect(  # type: ignore
-            host=DB_HOST,
-            port=DB_PORT,
-            database=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-        )
-
-        query = """
-            INSERT INTO tasks (title, description, user_id)
-            VALUES ($1, $2, $3)
-            RETURNING id, title, description, status, user_id
-        """
-        result = await conn.fetchrow(query, task.title, task.description, task.user_id)  # type: ignore
-        await conn.close()  # type: ignore
+        pool = await get_pool(request.app)
+        async with pool.acquire() as conn:  # type: ignore
+            result = await conn.fetchrow(  # type: ignore
+                INSERT_TASK_SQL, task.title, task.description, task.user_id
+            )
 
         # Log success with structured data
-        request_logger.info(
+        logger.info(
             "Task created successfully", 
             extra={
                 "user_id": task.user_id,
@@ -282,16 +457,10 @@ async def create_task(
             }
         )
 
-        return TaskResponse(
-            id=result["id"],  # type: ignore
-            title=result["title"],  # type: ignore
-            description=result["description"],  # type: ignore
-            status=result["status"],  # type: ignore
-            user_id=result["user_id"],  # type: ignore
-        )
+        return TaskResponse.from_row(result)  # type: ignore
     except Exception as e:
         # Log error with structured data
-        request_logger.error(
+        logger.error(
             "Error creating task", 
             extra={
                 "user_id": task.user_id,
@@ -304,18 +473,85 @@ async def create_task(
         raise HTTPException(status_code=500, detail=f"Database error: {e}") from e
 
 
+@app.post("/tasks/bulk", response_model=list[TaskResponse])
+async def create_tasks_bulk(
+    tasks: Annotated[list[Task], Body(min_length=1, max_length=TASKS_MAX_BULK)],
+    request: Request,
+) -> list[TaskResponse]:
+    """
+    Create several tasks in a single database round-trip.
+
+    Args:
+        tasks: The tasks to create, in the order they are returned
+        request: The FastAPI request object, used to reach the connection pool
+    """
+    logger.info(
+        "Creating tasks in bulk", 
+        extra={
+            "task_count": len(tasks),
+            "component": "api",
+            "operation": "create_tasks_bulk"
+        }
+    )
+    
+    try:
+        pool = await get_pool(request.app)
+        async with pool.acquire() as conn:  # type: ignore
+            rows = await conn.fetch(  # type: ignore
+                INSERT_TASKS_BULK_SQL,
+                [task.title for task in tasks],
+                [task.description for task in tasks],
+                [task.user_id for task in tasks],
+            )
+
+        # Log success with task count
+        logger.info(
+            "Tasks created successfully", 
+            extra={
+                "task_count": len(rows),  # type: ignore
+                "component": "api",
+                "operation": "create_tasks_bulk"
+            }
+        )
+
+        return [TaskResponse.from_row(row) for row in rows]  # type: ignore
+    except Exception as e:
+        # Log error with structured data
+        logger.error(
+            "Error creating tasks in bulk", 
+            extra={
+                "task_count": len(tasks),
+                "error": str(e),
+                "component": "api",
+                "operation": "create_tasks_bulk"
+            },
+            exc_info=True
+        )
+        raise HTTPException(status_code=500, detail=f"Database error: {e}") from e
+
+
 @app.get("/tasks", response_model=list[TaskResponse])
 async def list_tasks(
     user_id: str,
-    request_logger: LoggerAdapter[Logger] = Depends(get_request_logger_dependency)
+    request: Request,
+    response: Response,
+    limit: int = Query(TASKS_DEFAULT_LIMIT, ge=1, le=TASKS_MAX_LIMIT),
+    before_id: int | None = Query(None, ge=1, le=TASKS_MAX_ID),
 ) -> list[TaskResponse]:
     """
-    List tasks for a specific user.
+    List tasks for a specific user, newest first.
+
+    When a full page is returned, the X-Next-Before-ID response header holds
+    the before_id to pass for the next page.
 
     Args:
         user_id: The ID of the user whose tasks to retrieve
+        request: The FastAPI request object, used to reach the connection pool
+        response: The response, on which the pagination header is set
+        limit: The maximum number of tasks to return
+        before_id: Only return tasks with an ID lower than this one
     """
-    request_logger.info(
+    logger.info(
         "Fetching tasks for user", 
         extra={
             "user_id": user_id,
@@ -325,25 +561,23 @@ async def list_tasks(
     )
     
     try:
-        conn = await asyncpg.connect(  # type: ignore
-            host=DB_HOST,
-            port=DB_PORT,
-            database=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-        )
-
-        rows = await conn.fetch(  # type: ignore
-            """
-            SELECT id, title, description, status, user_id FROM tasks
-            WHERE user_id = $1 ORDER BY id DESC
-            """,
-            user_id,
-        )
-        await conn.close()  # type: ignore
+        pool = await get_pool(request.app)
+        async with pool.acquire() as conn:  # type: ignore
+            if before_id is None:
+                rows = await conn.fetch(  # type: ignore
+                    SELECT_TASKS_BY_USER_SQL, user_id, limit
+                )
+            else:
+                rows = await conn.fetch(  # type: ignore
+                    SELECT_TASKS_BY_USER_BEFORE_SQL, user_id, before_id, limit
+                )
+
+        # Point to the next page, which may exist if this one is full
+        if len(rows) == limit:  # type: ignore
+            response.headers["X-Next-Before-ID"] = str(rows[-1]["id"])  # type: ignore
 
         # Log success with task count
-        request_logger.info(
+        logger.info(
             "Tasks retrieved successfully", 
             extra={
                 "user_id": user_id,
@@ -353,19 +587,10 @@ async def list_tasks(
             }
         )
 
-        return [
-            TaskResponse(
-                id=row["id"],  # type: ignore
-                title=row["title"],  # type: ignore
-                description=row["description"],  # type: ignore
-                status=row["status"],  # type: ignore
-                user_id=row["user_id"],  # type: ignore
-            )
-            for row in rows  # type: ignore
-        ]
+        return [TaskResponse.from_row(row) for row in rows]  # type: ignore
     except Exception as e:
         # Log error with structured data
-        request_logger.error(
+        logger.error(
             "Error listing tasks for user", 
             extra={
                 "user_id": user_id,